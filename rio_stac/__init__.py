@@ -2,4 +2,26 @@
 
 __version__ = "0.12.0"
 
-from rio_stac.stac import build_stac_assets, create_stac_asset, create_stac_item  # noqa
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rio_stac.stac import build_stac_assets, create_stac_asset, create_stac_item
+
+__all__ = ["build_stac_assets", "create_stac_asset", "create_stac_item"]
+
+
+_SUBMODULES = {"stac", "scripts"}
+
+
+def __getattr__(name: str):
+    """Lazily import `rio_stac.stac` functions (keep `rio` plugins loading fast)."""
+    if name in __all__:
+        from rio_stac import stac
+
+        return getattr(stac, name)
+
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,39 +1,199 @@
 """rio_stac.scripts.cli."""
 
+import copy
+import functools
+import io
 import json
 import os
 import re
+import string
 
 import click
 import rasterio
-from pystac import MediaType
-from pystac.utils import datetime_to_str, str_to_datetime
+from rasterio.enums import Resampling
 from rasterio.rio import options
 
-from rio_stac import build_stac_assets, create_stac_item
+# NOTE: `pystac` and `rio_stac.stac` are imported within the functions to keep
+# `rio` (which loads all its plugins) fast to start.
 
+try:
+    import orjson
+except ImportError:  # pragma: nocover
+    orjson = None  # type: ignore
 
-_UNQUOTED_KEY_RE = re.compile(r'(?P<lead>[{,]\s*)(?P<key>[A-Za-z_][A-Za-z0-9_-]*)\s*:')
 
+_KEY_START_CHARS = frozenset(string.ascii_letters + "_")
+_KEY_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 
-def _parse_jsonish(value: str):
+# First characters a JSON (or single-quoted JSON-ish) value can start with.
+# `N` and `I` cover the `NaN`/`Infinity` literals accepted by `json.loads`.
+_JSON_LEADING_CHARS = frozenset("{[\"'-0123456789tfnNI")
+
+# RFC 3339 date-time, already valid for STAC `start_datetime`/`end_datetime`
+_RFC3339_RE = re.compile(
+    r"\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])"
+    r"T([01]\d|2[0-3]):[0-5]\d:[0-5]\d(\.\d+)?(Z|[+-]([01]\d|2[0-3]):[0-5]\d)$"
+)
+
+# GDAL block cache size used unless set via `--config` or the environment.
+# rasterio passes integer values straight to GDALSetCacheMax, i.e in bytes.
+_DEFAULT_GDAL_CACHEMAX = 512 * 1024 * 1024
+
+
+def _quote_unquoted_keys(value: str) -> str:
+    """Quote bare object keys (e.g `{hidden: true}` -> `{"hidden": true}`).
+
+    Keys are identifiers (`[A-Za-z_][A-Za-z0-9_-]*`) following `{` or `,`
+    and followed by `:`. Quoted strings are copied untouched.
+
+    """
+    out = io.StringIO()
+    size = len(value)
+    expect_key = False
+    quote = None
+    i = 0
+    while i < size:
+        char = value[i]
+
+        # Inside a string literal
+        if quote:
+            if char == "\\":
+                out.write(value[i : i + 2])
+                i += 2
+                continue
+            if char == quote:
+                quote = None
+            out.write(char)
+            i += 1
+            continue
+
+        if char in "\"'":
+            quote = char
+            expect_key = False
+
+        elif char in "{,":
+            expect_key = True
+
+        elif expect_key and char in _KEY_START_CHARS:
+            end = i + 1
+            while end < size and value[end] in _KEY_CHARS:
+                end += 1
+
+            colon = end
+            while colon < size and value[colon].isspace():
+                colon += 1
+
+            if colon < size and value[colon] == ":":
+                out.write(f'"{value[i:end]}":')
+                i = colon + 1
+            else:
+                out.write(value[i:end])
+                i = end
+
+            expect_key = False
+            continue
+
+        elif not char.isspace():
+            expect_key = False
+
+        out.write(char)
+        i += 1
+
+    return out.getvalue()
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON, using `orjson` when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_jsonish_cached(value: str):
     """Try to parse JSON, falling back to quoting unquoted keys."""
     stripped = value.strip()
-    candidates = [stripped, stripped.replace("'", '"')]
-    if stripped.startswith("{") or stripped.startswith("["):
-        candidates.append(
-            _UNQUOTED_KEY_RE.sub(lambda m: f'{m.group("lead")}"{m.group("key")}":', stripped)
-        )
+    # Plain strings (e.g `-p comment:name=something`) can't be JSON, skip the parser.
+    if not stripped or stripped[0] not in _JSON_LEADING_CHARS:
+        return value
 
-    for candidate in candidates:
+    try:
+        return json.loads(stripped)
+    except json.JSONDecodeError:
+        pass
+
+    try:
+        return json.loads(stripped.replace("'", '"'))
+    except json.JSONDecodeError:
+        pass
+
+    if stripped[0] in "{[":
         try:
-            return json.loads(candidate)
+            return json.loads(_quote_unquoted_keys(stripped))
         except json.JSONDecodeError:
-            continue
+            pass
 
     return value
 
 
+def _parse_jsonish(value: str):
+    """Parse a JSON-ish value, re-using previously parsed results."""
+    parsed = _parse_jsonish_cached(value)
+    # Cached containers are shared, hand out a copy so callers can mutate them.
+    if isinstance(parsed, (dict, list)):
+        return copy.deepcopy(parsed)
+
+    return parsed
+
+
+class MediaTypeParam(click.ParamType):
+    """Case-insensitive pystac MediaType name (or `auto`) parameter."""
+
+    name = "mediatype"
+
+    def get_metavar(self, param, ctx=None):
+        """List the media type names (like `click.Choice`)."""
+        from pystac import MediaType
+
+        return "[" + "|".join([*MediaType.__members__, "auto"]) + "]"
+
+    def convert(self, value, param, ctx):
+        """Return `auto` or the pystac MediaType matching the name."""
+        from pystac import MediaType
+
+        if isinstance(value, MediaType):
+            return value
+
+        if value.lower() == "auto":
+            return "auto"
+
+        media_type = MediaType.__members__.get(value.upper())
+        if media_type is None:
+            choices = ", ".join([*MediaType.__members__, "auto"])
+            self.fail(f"{value!r} is not one of {choices}.", param, ctx)
+
+        return media_type
+
+
+def _normalize_datetime(value: str) -> str:
+    """Return an RFC 3339 date-time string (RFC 3339 values are kept as-is)."""
+    from pystac.utils import datetime_to_str, str_to_datetime
+
+    try:
+        # Always parse the value to reject impossible dates (e.g `2010-02-31`)
+        parsed = str_to_datetime(value)
+    except (ValueError, OverflowError) as e:
+        raise click.BadParameter(
+            f"Invalid date-time {value!r}: {e}", param_hint="'--datetime'"
+        ) from e
+
+    if _RFC3339_RE.match(value):
+        return value
+
+    return datetime_to_str(parsed)
+
+
 def _cb_key_val(ctx, param, value):
     if not value:
         return {}
@@ -100,8 +260,8 @@ def _cb_key_val(ctx, param, value):
 @click.option("--asset-href", type=str, help="Overwrite asset href.")
 @click.option(
     "--asset-mediatype",
-    type=click.Choice([it.name for it in MediaType] + ["auto"]),
-    help="Asset media-type.",
+    type=MediaTypeParam(),
+    help="Asset media-type (case-insensitive pystac MediaType name or 'auto').",
 )
 @click.option(
     "--with-proj/--without-proj",
@@ -128,6 +288,33 @@ def _cb_key_val(ctx, param, value):
     help="Add the '_private' entry to output item. Implicitly enabled if -P or -p _private=... is used.",
     show_default=False,
 )
+@click.option(
+    "--stats/--no-stats",
+    "compute_stats",
+    default=True,
+    help="Compute raster statistics and histogram (requires reading the raster).",
+    show_default=True,
+)
+@click.option(
+    "--metadata-only",
+    is_flag=True,
+    default=False,
+    help="Only use the dataset's metadata (implies --without-raster --without-eo --no-stats).",
+)
+@click.option(
+    "--approx-stats/--exact-stats",
+    default=False,
+    help="Compute raster statistics from the dataset's coarsest overview.",
+    show_default=True,
+)
+@click.option(
+    "--raster-resampling",
+    # Methods supported by GDAL's RasterIO (others are warp-only)
+    type=click.Choice([r.name for r in Resampling if r <= Resampling.gauss]),
+    default="nearest",
+    help="Resampling method used to read the decimated raster for statistics.",
+    show_default=True,
+)
 @click.option(
     "--max-raster-size",
     type=int,
@@ -135,6 +322,13 @@ def _cb_key_val(ctx, param, value):
     help="Limit array size from which to get the raster statistics.",
     show_default=True,
 )
+@click.option(
+    "--histogram-bins",
+    type=click.IntRange(min=1),
+    default=10,
+    help="Number of bins of the raster histogram.",
+    show_default=True,
+)
 @click.option(
     "--densify-geom",
     type=int,
@@ -168,6 +362,20 @@ def _cb_key_val(ctx, param, value):
     multiple=True,
     help="Glob pattern to filter files when using --recursive.",
 )
+@click.option(
+    "--exclude-dir",
+    type=str,
+    multiple=True,
+    help="Glob pattern of sub-directory names to skip when using --recursive.",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=min(8, os.cpu_count() or 1),
+    help="Number of files to process concurrently when using --recursive.",
+    show_default=True,
+)
 def stac(
     input,
     input_datetime,
@@ -184,15 +392,26 @@ def stac(
     with_raster,
     with_eo,
     with_private,
+    compute_stats,
+    metadata_only,
+    approx_stats,
+    raster_resampling,
     max_raster_size,
+    histogram_bins,
     densify_geom,
     geom_precision,
     output,
     config,
     recursive,
     pattern,
+    exclude_dir,
+    jobs,
 ):
     """Rasterio STAC plugin: Create a STAC Item for raster dataset."""
+    from pystac.utils import str_to_datetime
+
+    from rio_stac import build_stac_assets, create_stac_item
+
     property = property or {}
     private_property = private_property or {}
     densify_geom = densify_geom or 0
@@ -217,102 +436,102 @@ def stac(
     if input_datetime:
         if "/" in input_datetime:
             start_datetime, end_datetime = input_datetime.split("/")
-            property["start_datetime"] = datetime_to_str(str_to_datetime(start_datetime))
-            property["end_datetime"] = datetime_to_str(str_to_datetime(end_datetime))
+            property["start_datetime"] = _normalize_datetime(start_datetime)
+            property["end_datetime"] = _normalize_datetime(end_datetime)
             input_datetime = None
         else:
             input_datetime = str_to_datetime(input_datetime)
 
-    if asset_mediatype and asset_mediatype != "auto":
-        asset_mediatype = MediaType[asset_mediatype]
-
     extensions = [e for e in extension if e]
 
+    # Skeleton Item, no pixel is read
+    if metadata_only:
+        with_raster = False
+        with_eo = False
+        compute_stats = False
+
+    config = dict(config or {})
+    if "GDAL_CACHEMAX" not in os.environ and not any(
+        k.upper() == "GDAL_CACHEMAX" for k in config
+    ):
+        config["GDAL_CACHEMAX"] = _DEFAULT_GDAL_CACHEMAX
+
+    item_options = {
+        "input_datetime": input_datetime,
+        "extensions": extensions,
+        "collection": collection,
+        "collection_url": collection_url,
+        "properties": property,
+        "id": id,
+        "asset_name": asset_name,
+        "asset_href": asset_href,
+        "asset_media_type": asset_mediatype,
+        "with_proj": with_proj,
+        "with_raster": with_raster,
+        "with_eo": with_eo,
+        "with_private": with_private,
+        "raster_max_size": max_raster_size,
+        "histogram_bins": histogram_bins,
+        "compute_stats": compute_stats,
+        "approx_stats": approx_stats,
+        "raster_resampling": Resampling[raster_resampling],
+        "geom_densify_pts": densify_geom,
+        "geom_precision": geom_precision,
+    }
+
     with rasterio.Env(**config):
         if recursive:
             if not os.path.isdir(input):
-                raise click.BadParameter("Input must be a directory when using --recursive.")
+                raise click.BadParameter(
+                    "Input must be a directory when using --recursive."
+                )
 
             assets = build_stac_assets(
                 directory=input,
                 patterns=list(pattern) if pattern else None,
+                exclude_dirs=exclude_dir or None,
                 asset_media_type=asset_mediatype,
                 with_raster=with_raster,
                 with_eo=with_eo,
                 raster_max_size=max_raster_size,
-                histogram_bins=10,  # Default
+                histogram_bins=histogram_bins,
+                compute_stats=compute_stats,
+                approx_stats=approx_stats,
+                raster_resampling=Resampling[raster_resampling],
+                jobs=jobs,
             )
 
             if not assets:
-                raise click.ClickException("No valid files found in directory matching criteria.")
+                raise click.ClickException(
+                    "No valid files found in directory matching criteria."
+                )
 
             # Determine source for Item geometry/bbox
-            source = None
-            # Prefer a "data" asset as source
-            for asset in assets.values():
-                if "data" in (asset.roles or []):
-                    # Re-construct full path for source opening
-                    # asset.href is relative (basename)
-                    source = os.path.join(input, asset.href)
-                    break
-
-            # Fallback to any asset if no data role found (e.g. only thumbnails?)
-            # Or fallback to first found
-            if not source and assets:
-                # Pick the first one that is likely a raster (not metadata)
-                for asset in assets.values():
-                    if "metadata" not in (asset.roles or []):
-                         source = os.path.join(input, asset.href)
-                         break
+            # Prefer a "data" asset as source, or fallback to the first non-metadata
+            # asset (e.g only thumbnails?)
+            source_asset = next(
+                (a for a in assets.values() if a.roles and "data" in a.roles), None
+            ) or next(
+                (a for a in assets.values() if not a.roles or "metadata" not in a.roles),
+                None,
+            )
+
+            # asset.href is relative to the input directory
+            source = os.path.join(input, source_asset.href) if source_asset else None
 
             if not source:
-                 raise click.ClickException("No valid raster asset found to derive Item geometry.")
+                raise click.ClickException(
+                    "No valid raster asset found to derive Item geometry."
+                )
 
             if not id:
-                id = os.path.basename(input.rstrip(os.sep))
-
-            item = create_stac_item(
-                source,
-                input_datetime=input_datetime,
-                extensions=extensions,
-                collection=collection,
-                collection_url=collection_url,
-                properties=property,
-                id=id,
-                assets=assets,
-                asset_name=asset_name,
-                asset_href=asset_href,
-                asset_media_type=asset_mediatype,
-                with_proj=with_proj,
-                with_raster=with_raster,
-                with_eo=with_eo,
-                with_private=with_private,
-                raster_max_size=max_raster_size,
-                geom_densify_pts=densify_geom,
-                geom_precision=geom_precision,
-            )
+                item_options["id"] = os.path.basename(os.path.normpath(input)) or "item"
+
+            item = create_stac_item(source, assets=assets, **item_options)
 
         else:
             try:
-                item = create_stac_item(
-                    input,
-                    input_datetime=input_datetime,
-                    extensions=extensions,
-                    collection=collection,
-                    collection_url=collection_url,
-                    properties=property,
-                    id=id,
-                    asset_name=asset_name,
-                    asset_href=asset_href,
-                    asset_media_type=asset_mediatype,
-                    with_proj=with_proj,
-                    with_raster=with_raster,
-                    with_eo=with_eo,
-                    with_private=with_private,
-                    raster_max_size=max_raster_size,
-                    geom_densify_pts=densify_geom,
-                    geom_precision=geom_precision,
-                )
+                item = create_stac_item(input, **item_options)
             except rasterio.errors.RasterioIOError:
                 if os.path.isdir(input):
                     raise click.ClickException(
@@ -321,7 +540,15 @@ def stac(
                 raise
 
     if output:
-        with open(output, "w") as f:
-            f.write(json.dumps(item.to_dict(), separators=(",", ":")))
+        # Write to a sibling file first so we never leave a truncated output
+        tmp_output = f"{output}.tmp"
+        try:
+            with open(tmp_output, "wb") as f:
+                f.write(_dumps(item.to_dict()))
+            os.replace(tmp_output, output)
+        except BaseException:
+            if os.path.exists(tmp_output):
+                os.remove(tmp_output)
+            raise
     else:
-        click.echo(json.dumps(item.to_dict(), separators=(",", ":")))
+        click.echo(_dumps(item.to_dict()))
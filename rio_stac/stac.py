@@ -2,10 +2,13 @@
 
 import datetime
 import fnmatch
+import functools
 import math
 import os
+import re
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
 
 import antimeridian
@@ -14,14 +17,28 @@ import pystac
 import rasterio
 from pystac.utils import str_to_datetime
 from rasterio import transform, warp
+from rasterio.enums import Resampling
 from rasterio.features import bounds as feature_bounds
 from rasterio.io import DatasetReader, DatasetWriter, MemoryFile
 from rasterio.vrt import WarpedVRT
 
+try:
+    from fast_histogram import histogram1d
+except ImportError:  # pragma: nocover
+    histogram1d = None  # type: ignore
+
 PROJECTION_EXT_VERSION = "v2.0.0"
 RASTER_EXT_VERSION = "v2.0.0"
 EO_EXT_VERSION = "v2.0.0"
 
+PROJECTION_EXT_URL = (
+    f"https://stac-extensions.github.io/projection/{PROJECTION_EXT_VERSION}/schema.json"
+)
+RASTER_EXT_URL = (
+    f"https://stac-extensions.github.io/raster/{RASTER_EXT_VERSION}/schema.json"
+)
+EO_EXT_URL = f"https://stac-extensions.github.io/eo/{EO_EXT_VERSION}/schema.json"
+
 EO_COMMON_NAME_VALUES = {
     "pan",
     "coastal",
@@ -45,25 +62,67 @@ EO_COMMON_NAME_VALUES = {
     "lwir12",
 }
 
+# Band names mapped to the `pan` common name
+EO_PAN_ALIASES = frozenset({"gray", "grey"})
+
+# Upper bound of the decimated pixels (and masks) read at once for bands statistics
+STATS_READ_MAX_BYTES = 64 * 1024 * 1024
+
 EPSG_4326 = rasterio.crs.CRS.from_epsg(4326)
 
+# Asset fields removed from thumbnail assets
+THUMBNAIL_FORBIDDEN_FIELDS = frozenset(
+    {"bands", "eo:bands", "raster:bands", "statistics", "stats"}
+)
+
 
 def bbox_to_geom(bbox: tuple[float, float, float, float]) -> dict:
     """Return a geojson geometry from a bbox."""
+    x0, y0, x1, y1 = bbox
     return {
         "type": "Polygon",
-        "coordinates": [
-            [
-                [bbox[0], bbox[1]],
-                [bbox[2], bbox[1]],
-                [bbox[2], bbox[3]],
-                [bbox[0], bbox[3]],
-                [bbox[0], bbox[1]],
-            ]
-        ],
+        "coordinates": (((x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)),),
     }
 
 
+def _transform_ring(
+    src_crs: rasterio.crs.CRS,
+    dst_crs: rasterio.crs.CRS,
+    coordinates: numpy.ndarray,
+    precision: int = -1,
+) -> dict:
+    """Reproject a polygon exterior ring.
+
+    Points are reprojected with `warp.transform`. When the result is not finite or
+    may cross the dateline, `warp.transform_geom` is used so GDAL can cut it.
+
+    """
+    xs, ys = warp.transform(src_crs, dst_crs, coordinates[:, 0], coordinates[:, 1])
+    xs = numpy.asarray(xs, dtype="float64")
+    ys = numpy.asarray(ys, dtype="float64")
+    if (
+        not numpy.isfinite(xs).all()
+        or not numpy.isfinite(ys).all()
+        or numpy.abs(numpy.diff(xs)).max() > 180
+    ):
+        return warp.transform_geom(
+            src_crs,
+            dst_crs,
+            {"type": "Polygon", "coordinates": [coordinates.tolist()]},
+            precision=precision,
+        )
+
+    if precision >= 0:
+        ring = [
+            (round(x, precision), round(y, precision))
+            for x, y in zip(xs.tolist(), ys.tolist())
+        ]
+    else:
+        ring = list(zip(xs.tolist(), ys.tolist()))
+
+    return {"type": "Polygon", "coordinates": [ring]}
+
+
 def get_dataset_geom(
     src_dst: DatasetReader | DatasetWriter | WarpedVRT | MemoryFile,
     densify_pts: int = 0,
@@ -74,28 +133,41 @@ def get_dataset_geom(
     if densify_pts < 0:
         raise ValueError("`densify_pts` must be positive")
 
-    if src_dst.crs is not None:
-        # 1. Create Polygon from raster bounds
-        geom = bbox_to_geom(src_dst.bounds)
-
-        # 2. Densify the Polygon geometry
-        if src_dst.crs != geographic_crs and densify_pts:
-            # Derived from code found at
-            # https://stackoverflow.com/questions/64995977/generating-equidistance-points-along-the-boundary-of-a-polygon-but-cw-ccw
-            coordinates = numpy.asarray(geom["coordinates"][0])
-
-            densified_number = len(coordinates) * densify_pts
-            existing_indices = numpy.arange(0, densified_number, densify_pts)
-            interp_indices = numpy.arange(existing_indices[-1] + 1)
-            interp_x = numpy.interp(interp_indices, existing_indices, coordinates[:, 0])
-            interp_y = numpy.interp(interp_indices, existing_indices, coordinates[:, 1])
-            geom = {
-                "type": "Polygon",
-                "coordinates": [[(x, y) for x, y in zip(interp_x, interp_y)]],
-            }
+    crs = src_dst.crs
+    if crs is not None:
+        bounds = src_dst.bounds
+        is_geographic = crs == geographic_crs
+
+        if (
+            is_geographic
+            and all(-180 <= x <= 180 for x in bounds[::2])
+            and all(-90 <= y <= 90 for y in bounds[1::2])
+        ):
+            # No reprojection needed (nor dateline wrapping by GDAL)
+            if precision >= 0:
+                bounds = [round(v, precision) for v in bounds]
+            geom = bbox_to_geom(bounds)
+
+        else:
+            # 1. Create Polygon from raster bounds
+            coordinates = numpy.asarray(
+                bbox_to_geom(bounds)["coordinates"][0], dtype="float64"
+            )
+
+            # 2. Densify the Polygon geometry
+            if densify_pts and not is_geographic:
+                # `densify_pts` evenly spaced points on each edge (starting at its
+                # first corner), then the closing corner
+                steps = numpy.arange(densify_pts) / densify_pts
+                edges = coordinates[1:] - coordinates[:-1]
+                points = (
+                    coordinates[:-1, None, :] + steps[None, :, None] * edges[:, None, :]
+                )
+                coordinates = numpy.concatenate((points.reshape(-1, 2), coordinates[-1:]))
+
+            # 3. Reproject the geometry to "epsg:4326"
+            geom = _transform_ring(crs, geographic_crs, coordinates, precision)
 
-        # 3. Reproject the geometry to "epsg:4326"
-        geom = warp.transform_geom(src_dst.crs, geographic_crs, geom, precision=precision)
         bbox = feature_bounds(geom)
 
     else:
@@ -108,6 +180,52 @@ def get_dataset_geom(
     return {"bbox": list(bbox), "footprint": geom}
 
 
+def _fix_antimeridian(geom: dict) -> dict:
+    """Split geometry crossing the antimeridian.
+
+    `antimeridian.fix_geojson` is only called when the polygon has a vertex on or past
+    ±180° or an edge spanning more than 180° of longitude. Otherwise only the winding
+    is fixed (counter-clockwise exterior ring), as `antimeridian` would do.
+
+    """
+    if geom["type"] != "Polygon" or len(geom["coordinates"]) != 1:
+        return antimeridian.fix_geojson(geom)
+
+    ring = numpy.asarray(geom["coordinates"][0], dtype="float64")
+    x, y = ring[:, 0], ring[:, 1]
+    if numpy.abs(x).max() >= 180 or numpy.abs(numpy.diff(x)).max() > 180:
+        return antimeridian.fix_geojson(geom)
+
+    # Shoelace formula: a negative signed area means a clockwise ring
+    if numpy.dot(x[:-1], y[1:]) - numpy.dot(x[1:], y[:-1]) < 0:
+        return {"type": "Polygon", "coordinates": [ring[::-1].tolist()]}
+
+    return geom
+
+
+def _crs_code(crs: rasterio.crs.CRS) -> str | None:
+    """Get the `{authority}:{code}` of a CRS."""
+    code = None
+    try:
+        authority, value = crs.to_authority()
+        if authority and value:
+            code = f"{authority}:{value}"
+    except Exception:
+        # Fallback to EPSG if authority extraction fails
+        code = None
+    if not code and crs.is_epsg_code:
+        epsg = crs.to_epsg()
+        code = f"EPSG:{epsg}" if epsg else None
+
+    return code
+
+
+@functools.lru_cache(maxsize=64)
+def _crs_code_from_wkt(wkt: str) -> str | None:
+    """Get the `{authority}:{code}` of a CRS from its WKT (cached)."""
+    return _crs_code(rasterio.crs.CRS.from_wkt(wkt))
+
+
 def get_projection_info(
     src_dst: DatasetReader | DatasetWriter | WarpedVRT | MemoryFile,
 ) -> dict:
@@ -126,42 +244,53 @@ def get_projection_info(
 
     """
 
+    crs = src_dst.crs
+    bounds = src_dst.bounds
+
     code = None
-    if src_dst.crs is not None:
+    wkt = None
+    if crs is not None:
         try:
-            authority, value = src_dst.crs.to_authority()
-            if authority and value:
-                code = f"{authority}:{value}"
+            wkt = crs.to_wkt()
         except Exception:
-            # Fallback to EPSG if authority extraction fails
-            code = None
-        if not code and src_dst.crs.is_epsg_code:
-            epsg = src_dst.crs.to_epsg()
-            code = f"EPSG:{epsg}" if epsg else None
+            wkt = None
+
+        # Datasets of a same collection usually share their CRS
+        code = _crs_code_from_wkt(wkt) if wkt else _crs_code(crs)
 
     meta = {
         "code": code,
-        "geometry": bbox_to_geom(src_dst.bounds),
-        "bbox": list(src_dst.bounds),
+        "geometry": bbox_to_geom(bounds),
+        "bbox": list(bounds),
         "shape": [src_dst.height, src_dst.width],
         "transform": list(src_dst.transform),
     }
 
-    if not code and src_dst.crs:
+    if not code and crs:
         # WKT2
         try:
-            meta["wkt2"] = src_dst.crs.to_wkt()
+            meta["wkt2"] = wkt or crs.to_wkt()
         except Exception as ex:
             warnings.warn(f"Could not get WKT2 from dataset : {ex}")
             # PROJJSON
             try:
-                meta["projjson"] = src_dst.crs.to_dict(projjson=True)
+                meta["projjson"] = crs.to_dict(projjson=True)
             except (AttributeError, TypeError) as ex:
                 warnings.warn(f"Could not get PROJJSON from dataset : {ex}")
 
     return meta
 
 
+@functools.lru_cache(maxsize=256)
+def _eo_common_name(name: str) -> str | None:
+    """Get the eo:common_name matching a band description or color name."""
+    common_name = name.strip().lower().replace(" ", "")
+    if common_name in EO_PAN_ALIASES:
+        common_name = "pan"
+
+    return common_name if common_name in EO_COMMON_NAME_VALUES else None
+
+
 def get_eobands_info(
     src_dst: DatasetReader | DatasetWriter | WarpedVRT | MemoryFile,
 ) -> list:
@@ -173,12 +302,14 @@ def get_eobands_info(
     eo_bands = []
 
     colors = src_dst.colorinterp
+    descriptions = src_dst.descriptions
+    dataset_imagery_tags = src_dst.tags(ns="IMAGERY")
     for ix in src_dst.indexes:
         band_meta = {"name": f"b{ix}"}
 
-        descr = src_dst.descriptions[ix - 1]
+        descr = descriptions[ix - 1]
         color = colors[ix - 1].name if colors else None
-        imagery_tags = src_dst.tags(ix, ns="IMAGERY") or src_dst.tags(ns="IMAGERY")
+        imagery_tags = src_dst.tags(ix, ns="IMAGERY") or dataset_imagery_tags
 
         # Description metadata or Colorinterp or Nothing
         description = descr or color
@@ -186,12 +317,8 @@ def get_eobands_info(
             band_meta["description"] = description
 
         for candidate in (descr, color):
-            if not candidate:
-                continue
-            common_name = candidate.strip().lower().replace(" ", "")
-            if common_name in {"gray", "grey"}:
-                common_name = "pan"
-            if common_name in EO_COMMON_NAME_VALUES:
+            common_name = _eo_common_name(candidate) if candidate else None
+            if common_name:
                 band_meta["eo:common_name"] = common_name
                 break
 
@@ -214,38 +341,147 @@ def get_eobands_info(
     return eo_bands
 
 
+def _histogram(
+    data: numpy.ndarray,
+    bins: int | str | Sequence = 10,
+    range: tuple[float, float] | None = None,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Compute histogram (`numpy.histogram` compatible).
+
+    8/16 bits integer values are counted with `numpy.bincount`, other data uses
+    `fast_histogram` (if installed) for a number of uniform bins.
+
+    """
+    if isinstance(bins, str) or not data.size:
+        return numpy.histogram(data, bins=bins, range=range)
+
+    if numpy.issubdtype(data.dtype, numpy.integer) and data.dtype.itemsize <= 2:
+        # Count each possible value, then bin the distinct values weighted by
+        # their count (same bins as numpy.histogram on the data)
+        offset = int(numpy.iinfo(data.dtype).min)
+        counts = numpy.bincount(
+            data.ravel() if offset == 0 else data.ravel().astype(numpy.intp) - offset
+        )
+        values = numpy.arange(offset, offset + counts.size)
+        if range is None:
+            present = numpy.flatnonzero(counts)
+            range = (values[present[0]], values[present[-1]])
+
+        sample, edges = numpy.histogram(values, bins=bins, range=range, weights=counts)
+        return sample.astype(numpy.intp), edges
+
+    if (
+        histogram1d is not None
+        and isinstance(bins, (int, numpy.integer))
+        and not isinstance(bins, bool)
+    ):
+        if range is None:
+            range = (data.min(), data.max())
+
+        # Same edges (and errors) as numpy.histogram
+        edges = numpy.histogram_bin_edges(data, bins=bins, range=range)
+        first, last = float(edges[0]), float(edges[-1])
+        sample = histogram1d(data, bins=bins, range=(first, last)).astype(numpy.intp)
+
+        # fast_histogram and numpy.histogram can bin values lying on (or within
+        # rounding error of) a bin edge differently (e.g the last edge, which is
+        # included by numpy): re-bin these values with numpy.histogram.
+        norm = bins / (last - first)
+        index = numpy.subtract(data, first, dtype=numpy.float64)
+        index *= norm
+        index -= numpy.rint(index)
+        tolerance = (
+            16 * numpy.finfo(edges.dtype).eps * (bins + max(abs(first), abs(last)) * norm)
+        )
+        on_edges = data[numpy.abs(index, out=index) <= tolerance]
+        if on_edges.size:
+            sample += numpy.histogram(on_edges, bins=bins, range=range)[0]
+            sample -= histogram1d(on_edges, bins=bins, range=(first, last)).astype(
+                numpy.intp
+            )
+
+        return sample, edges
+
+    return numpy.histogram(data, bins=bins, range=range)
+
+
+def _count_unique(data: numpy.ndarray) -> int:
+    """Count distinct values (without sorting for integers with a small range)."""
+    if data.size and numpy.issubdtype(data.dtype, numpy.integer):
+        vmin = int(data.min())
+        if int(data.max()) - vmin <= data.size:
+            # Offset values from the minimum (avoid signed integer overflow)
+            if numpy.issubdtype(data.dtype, numpy.unsignedinteger):
+                offsets = data - data.dtype.type(vmin)
+            else:
+                offsets = data.astype(numpy.int64) - vmin
+
+            return int(numpy.count_nonzero(numpy.bincount(offsets.ravel())))
+
+    return len(numpy.unique(data))
+
+
 def _get_stats(
     arr: numpy.ma.MaskedArray,
     bins: int | str | Sequence = 10,
     range: tuple[float, float] | None = None,
 ) -> dict:
     """Calculate array statistics."""
-    # Avoid non masked nan/inf values
-    arr = numpy.ma.fix_invalid(arr, copy=True)
-
-    stats = {
-        "statistics": {
-            "mean": arr.mean().item(),
-            "minimum": arr.min().item(),
-            "maximum": arr.max().item(),
-            "stddev": arr.std().item(),
-            "valid_percent": float(
-                numpy.count_nonzero(~arr.mask) / float(arr.data.size) * 100
-            ),
+    arr = numpy.ma.asarray(arr)
+    mask = numpy.ma.getmask(arr)
+
+    # Avoid non masked nan/inf values (added to the mask, the data is not copied)
+    if numpy.issubdtype(arr.dtype, numpy.inexact):
+        invalid = ~numpy.isfinite(arr.data)
+        if invalid.any():
+            mask = invalid if mask is numpy.ma.nomask else mask | invalid
+
+    # Valid (non-masked) values, computed once. Without masked values we use
+    # the underlying data directly (no copy).
+    if mask is not numpy.ma.nomask and mask.any():
+        valid = arr.data[~mask]
+    else:
+        valid = arr.data.ravel()
+
+    if valid.size:
+        # Accumulate in float64 (float32 sums drift, e.g a non-zero stddev for
+        # constant bands)
+        mean = valid.mean(dtype=numpy.float64)
+        vmin, vmax = valid.min(), valid.max()
+        # Derive the standard deviation from the mean (`valid.std()` would compute
+        # the mean again) and sum the squared deviations with a single dot product.
+        deviations = numpy.subtract(valid, mean, dtype=numpy.float64)
+        statistics = {
+            "mean": mean.item(),
+            "minimum": vmin.item(),
+            "maximum": vmax.item(),
+            "stddev": math.sqrt(numpy.dot(deviations, deviations) / valid.size),
         }
-    }
+
+        # Re-use the data range for the histogram (same edges as numpy.histogram
+        # would get from `range=None`, without scanning the data again)
+        data_range = (vmin, vmax)
+    else:
+        # Fully masked arrays have all statistics set to 0
+        statistics = {"mean": 0.0, "minimum": 0.0, "maximum": 0.0, "stddev": 0.0}
+        data_range = None
+
+    statistics["valid_percent"] = float(valid.size / arr.size * 100)
+    stats = {"statistics": statistics}
 
     try:
-        sample, edges = numpy.histogram(arr[~arr.mask], bins=bins, range=range)
+        sample, edges = _histogram(
+            valid, bins=bins, range=data_range if range is None else range
+        )
 
     except ValueError as e:
         if "Too many bins for data range." in str(e):
-            _, counts = numpy.unique(arr[~arr.mask], return_counts=True)
+            nbins = _count_unique(valid) + 1
             warnings.warn(
-                f"Could not calculate the histogram, fall back to automatic bin={len(counts) + 1}.",
+                f"Could not calculate the histogram, fall back to automatic bin={nbins}.",
                 UserWarning,
             )
-            sample, edges = numpy.histogram(arr[~arr.mask], bins=len(counts) + 1)
+            sample, edges = _histogram(valid, bins=nbins, range=data_range)
         else:
             raise e
 
@@ -259,19 +495,115 @@ def _get_stats(
     return stats
 
 
+def _nodata_value(nodata: float | None) -> float | str | None:
+    """Return nodata as a JSON-compatible value (non-finite values as strings)."""
+    if nodata is None:
+        return None
+    if numpy.isnan(nodata):
+        return "nan"
+    if numpy.isposinf(nodata):
+        return "inf"
+    if numpy.isneginf(nodata):
+        return "-inf"
+    return nodata
+
+
+def _bands_stats(
+    src_dst: DatasetReader | DatasetWriter | WarpedVRT | MemoryFile,
+    shape: tuple[int, int],
+    resampling: Resampling = Resampling.nearest,
+    workers: int | None = None,
+    **kwargs,
+) -> list[dict]:
+    """Compute statistics for all bands, read decimated to `shape`.
+
+    Consecutive bands of the same data type are read in groups (one decimated read
+    per group instead of one per band) holding at most `STATS_READ_MAX_BYTES`, so
+    memory doesn't grow with the number of bands.
+
+    """
+    groups: list[list[int]] = []
+    group_bytes = 0
+    previous_dtype = None
+    for band, dtype in zip(src_dst.indexes, src_dst.dtypes):
+        # data + mask (one byte per pixel)
+        band_bytes = shape[0] * shape[1] * (numpy.dtype(dtype).itemsize + 1)
+        # rasterio can't read bands of different data types at once
+        if (
+            groups
+            and dtype == previous_dtype
+            and group_bytes + band_bytes <= STATS_READ_MAX_BYTES
+        ):
+            groups[-1].append(band)
+            group_bytes += band_bytes
+        else:
+            groups.append([band])
+            group_bytes = band_bytes
+        previous_dtype = dtype
+
+    if not groups:
+        return []
+
+    band_stats = functools.partial(_get_stats, **kwargs)
+    workers = workers or min(max(map(len, groups)), os.cpu_count() or 1, 4)
+
+    stats: list[dict] = []
+    with ExitStack() as ctx:
+        # numpy releases the GIL in reductions, bands are processed concurrently
+        executor = (
+            ctx.enter_context(ThreadPoolExecutor(max_workers=workers))
+            if workers > 1
+            else None
+        )
+        for indexes in groups:
+            data = src_dst.read(
+                indexes,
+                out_shape=(len(indexes), *shape),
+                masked=True,
+                resampling=resampling,
+            )
+            stats.extend(
+                executor.map(band_stats, data) if executor else map(band_stats, data)
+            )
+
+    return stats
+
+
 def get_raster_info(
     src_dst: DatasetReader | DatasetWriter | WarpedVRT | MemoryFile,
     max_size: int = 1024,
     histogram_bins: int | str | Sequence = 10,
     histogram_range: tuple[float, float] | None = None,
+    compute_stats: bool = True,
+    approx_stats: bool = False,
+    resampling: Resampling = Resampling.nearest,
+    stats_workers: int | None = None,
 ) -> list[dict]:
     """Get raster metadata.
 
+    When `compute_stats` is False, no pixel is read and `statistics`/`raster:histogram`
+    are not returned. Otherwise bands are read decimated to `max_size` with `resampling`,
+    which GDAL serves from the closest overview when the dataset has some. When
+    `approx_stats` is True, statistics are computed from the dataset's coarsest overview
+    (if smaller than `max_size`). Bands are read in groups of at most
+    `STATS_READ_MAX_BYTES` and their statistics computed in `stats_workers` threads
+    (default to the number of bands per group, up to 4 and the number of CPUs).
+
     see: https://github.com/stac-extensions/raster#raster-band-object
 
     """
     height = src_dst.height
     width = src_dst.width
+    if compute_stats and approx_stats:
+        try:
+            decimation = max(src_dst.overviews(1), default=0)
+        except Exception:
+            decimation = 0
+
+        if decimation:
+            height = math.ceil(height / decimation)
+            width = math.ceil(width / decimation)
+
     if max_size:
         if max(width, height) > max_size:
             ratio = height / width
@@ -284,40 +616,50 @@ def get_raster_info(
 
     meta: list[dict] = []
 
-    area_or_point = src_dst.tags().get("AREA_OR_POINT", "").lower()
+    area_or_point = (src_dst.get_tag_item("AREA_OR_POINT") or "").lower()
+
+    stats: list[dict] = []
+    if compute_stats:
+        stats = _bands_stats(
+            src_dst,
+            (height, width),
+            resampling=resampling,
+            workers=stats_workers,
+            bins=histogram_bins,
+            range=histogram_range,
+        )
+
+    dtypes = src_dst.dtypes
+    scales = src_dst.scales
+    offsets = src_dst.offsets
+    units = src_dst.units
+
+    # Dataset-level fields, the same for every band
+    shared: dict = {}
+    if area_or_point:
+        shared["raster:sampling"] = area_or_point
+
+    # If the Nodata is not set we don't forward it.
+    nodata = _nodata_value(src_dst.nodata)
+    if nodata is not None:
+        shared["nodata"] = nodata
 
     # Missing `bits_per_sample` and `spatial_resolution`
-    for band in src_dst.indexes:
+    for idx, band in enumerate(src_dst.indexes):
         value = {
             "name": f"b{band}",
-            "data_type": src_dst.dtypes[band - 1],
-            "raster:scale": src_dst.scales[band - 1],
-            "raster:offset": src_dst.offsets[band - 1],
+            "data_type": dtypes[band - 1],
+            "raster:scale": scales[band - 1],
+            "raster:offset": offsets[band - 1],
+            **shared,
         }
-        if area_or_point:
-            value["raster:sampling"] = area_or_point
-
-        # If the Nodata is not set we don't forward it.
-        if src_dst.nodata is not None:
-            if numpy.isnan(src_dst.nodata):
-                value["nodata"] = "nan"
-            elif numpy.isposinf(src_dst.nodata):
-                value["nodata"] = "inf"
-            elif numpy.isneginf(src_dst.nodata):
-                value["nodata"] = "-inf"
-            else:
-                value["nodata"] = src_dst.nodata
 
-        if src_dst.units[band - 1] is not None:
-            value["unit"] = src_dst.units[band - 1]
+        if units[band - 1] is not None:
+            value["unit"] = units[band - 1]
+
+        if stats:
+            value.update(stats[idx])
 
-        value.update(
-            _get_stats(
-                src_dst.read(indexes=band, out_shape=(height, width), masked=True),
-                bins=histogram_bins,
-                range=histogram_range,
-            )
-        )
         meta.append(value)
 
     return meta
@@ -361,10 +703,86 @@ def get_media_type(
     return None
 
 
+def _compile_patterns(patterns: Iterable[str]) -> re.Pattern | None:
+    """Compile glob patterns into a single regex (`fnmatch.fnmatch` semantic)."""
+    regex = "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+    return re.compile(regex) if regex else None
+
+
+def _walk_files(directory: str, exclude_dirs: Sequence[str] | None = None):
+    """Yield non-hidden file paths from a directory tree.
+
+    Files are yielded sorted by name (directory by directory), so assets order
+    doesn't depend on the filesystem. Sub-directories whose name match one of the
+    `exclude_dirs` glob patterns are pruned before being scanned. `DirEntry` type
+    checks are cached from the directory listing, so no extra `stat` call is needed
+    per file. Unreadable directories are skipped (as `os.walk` does by default).
+
+    """
+    subdirs = []
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        # Like `os.walk`, skip directories that can't be listed
+        return
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+
+        if is_dir:
+            # Like `os.walk`, don't follow symlinked directories
+            if entry.is_symlink():
+                continue
+            if exclude_dirs and any(
+                fnmatch.fnmatch(entry.name, pattern) for pattern in exclude_dirs
+            ):
+                continue
+            subdirs.append(entry.path)
+            continue
+
+        if entry.name.startswith(".") or not entry.is_file():
+            continue
+
+        yield entry.path
+
+    for subdir in subdirs:
+        yield from _walk_files(subdir, exclude_dirs=exclude_dirs)
+
+
+def _create_raster_asset(fpath: str, href: str, **kwargs) -> pystac.Asset | None:
+    """Create a STAC Asset from a raster file or return None if not a supported raster."""
+    try:
+        with rasterio.open(fpath) as src:
+            # Logic Rule 1: No CRS and 3 bands -> thumbnail
+            roles = ["data"]
+            if src.crs is None and src.count == 3:
+                roles = ["thumbnail"]
+
+            # Use create_stac_asset logic
+            asset, _ = create_stac_asset(
+                source=src,
+                asset_href=href,
+                asset_roles=roles,
+                **kwargs,
+            )
+            return asset
+
+    except rasterio.errors.RasterioIOError:
+        # Not a supported raster
+        return None
+    except Exception:
+        return None
+
+
 def build_stac_assets(
     directory: str | None = None,
     paths: list[str] | None = None,
     patterns: list[str] | None = None,
+    exclude_dirs: Sequence[str] | None = None,
     asset_media_type: str | pystac.MediaType | None = "auto",
     with_proj: bool = True,
     with_raster: bool = False,
@@ -372,103 +790,112 @@ def build_stac_assets(
     raster_max_size: int = 1024,
     histogram_bins: int | str | Sequence = 10,
     histogram_range: tuple[float, float] | None = None,
+    compute_stats: bool = True,
+    approx_stats: bool = False,
+    raster_resampling: Resampling = Resampling.nearest,
+    jobs: int = 1,
 ) -> dict[str, pystac.Asset]:
-    """Build STAC Assets from files."""
+    """Build STAC Assets from files.
+
+    Raster files are opened and described using `jobs` worker threads.
+    When `jobs > 1`, bands statistics of each file are computed in its worker thread.
+
+    """
     assets = {}
     files = []
 
     if paths:
-        files.extend(paths)
+        files.extend(p for p in paths if os.path.isfile(p))
 
     if directory:
-        for root, _, filenames in os.walk(directory):
-            for f in filenames:
-                if f.startswith("."):
-                    continue
-                files.append(os.path.join(root, f))
+        files.extend(_walk_files(directory, exclude_dirs=exclude_dirs))
 
     filtered_files = []
     if patterns:
+        # Patterns with a separator match the path relative to the directory,
+        # others match the filename. Each group is compiled into one regex.
+        path_re = _compile_patterns(p for p in patterns if "/" in p or os.sep in p)
+        name_re = _compile_patterns(
+            p for p in patterns if "/" not in p and os.sep not in p
+        )
+
         for f in files:
-            matched = False
-            rel_path = os.path.relpath(f, directory) if directory else f
-            filename = os.path.basename(f)
-            
-            for pattern in patterns:
-                if "/" in pattern or os.sep in pattern:
-                    if fnmatch.fnmatch(rel_path, pattern):
-                        matched = True
-                        break
-                else:
-                    if fnmatch.fnmatch(filename, pattern):
-                        matched = True
-                        break
-            
-            if matched:
+            if name_re and name_re.match(os.path.normcase(os.path.basename(f))):
                 filtered_files.append(f)
+
+            elif path_re:
+                rel_path = os.path.relpath(f, directory) if directory else f
+                if path_re.match(os.path.normcase(rel_path)):
+                    filtered_files.append(f)
     else:
         filtered_files = files
 
-    for fpath in filtered_files:
-        if not os.path.isfile(fpath):
-            continue
+    raster_options = {
+        "asset_media_type": asset_media_type,
+        "with_proj": with_proj,
+        "with_raster": with_raster,
+        "with_eo": with_eo,
+        "raster_max_size": raster_max_size,
+        "histogram_bins": histogram_bins,
+        "histogram_range": histogram_range,
+        "compute_stats": compute_stats,
+        "approx_stats": approx_stats,
+        "raster_resampling": raster_resampling,
+    }
 
-        if directory and fpath.startswith(directory):
-             href = os.path.relpath(fpath, directory)
-        else:
-             href = os.path.basename(fpath)
+    # Raster assets are created in worker threads (GDAL releases the GIL on I/O),
+    # we keep `(key, asset or future)` pairs to preserve the files order.
+    candidates: list[tuple[str, pystac.Asset | Future]] = []
+    # No more workers than files to describe (and never more than 32)
+    max_workers = max(min(jobs, len(filtered_files), 32), 1)
+    if max_workers > 1:
+        # Files are already processed concurrently, don't start a bands statistics
+        # thread pool (and GDAL block caches) in each worker
+        raster_options["stats_workers"] = 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for fpath in filtered_files:
+            if directory and fpath.startswith(directory):
+                href = os.path.relpath(fpath, directory)
+            else:
+                href = os.path.basename(fpath)
 
-        key = os.path.splitext(os.path.basename(fpath))[0]
+            key, ext = os.path.splitext(os.path.basename(fpath))
+            ext = ext.lower()
 
-        # Check for Metadata (JSON/XML/SAFE)
-        if fpath.lower().endswith((".json", ".xml", ".safe")):
-            mtype = (
-                pystac.MediaType.JSON
-                if fpath.lower().endswith(".json")
-                else pystac.MediaType.XML
-            )
-            assets[key] = pystac.Asset(
-                href=href, media_type=mtype, roles=["metadata"]
-            )
-            continue
+            # Check for Metadata (JSON/XML/SAFE)
+            if ext in (".json", ".xml", ".safe"):
+                mtype = pystac.MediaType.JSON if ext == ".json" else pystac.MediaType.XML
+                candidates.append(
+                    (key, pystac.Asset(href=href, media_type=mtype, roles=["metadata"]))
+                )
+                continue
 
-        # Check for Sentinel-2 Quicklook
-        if fpath.lower().endswith("ql.jpg") or fpath.lower().endswith("ql.jpeg"):
-             assets[key] = pystac.Asset(
-                href=href,
-                media_type=pystac.MediaType.JPEG,
-                roles=["thumbnail"],
-             )
-             continue
+            # Check for Sentinel-2 Quicklook
+            if ext in (".jpg", ".jpeg") and key.lower().endswith("ql"):
+                candidates.append(
+                    (
+                        key,
+                        pystac.Asset(
+                            href=href,
+                            media_type=pystac.MediaType.JPEG,
+                            roles=["thumbnail"],
+                        ),
+                    )
+                )
+                continue
 
-        # Try Raster
-        try:
-            with rasterio.open(fpath) as src:
-                # Logic Rule 1: No CRS and 3 bands -> thumbnail
-                roles = ["data"]
-                if src.crs is None and src.count == 3:
-                    roles = ["thumbnail"]
-
-                # Use create_stac_asset logic
-                asset, _ = create_stac_asset(
-                    source=src,
-                    asset_href=href,
-                    asset_roles=roles,
-                    asset_media_type=asset_media_type,
-                    with_proj=with_proj,
-                    with_raster=with_raster,
-                    with_eo=with_eo,
-                    raster_max_size=raster_max_size,
-                    histogram_bins=histogram_bins,
-                    histogram_range=histogram_range,
+            # Try Raster
+            candidates.append(
+                (
+                    key,
+                    executor.submit(_create_raster_asset, fpath, href, **raster_options),
                 )
-                assets[key] = asset
+            )
 
-        except rasterio.errors.RasterioIOError:
-            # Not a supported raster
-            continue
-        except Exception:
-            continue
+        for key, candidate in candidates:
+            asset = candidate.result() if isinstance(candidate, Future) else candidate
+            if asset is not None:
+                assets[key] = asset
 
     return assets
 
@@ -484,6 +911,10 @@ def create_stac_asset(
     raster_max_size: int = 1024,
     histogram_bins: int | str | Sequence = 10,
     histogram_range: tuple[float, float] | None = None,
+    compute_stats: bool = True,
+    approx_stats: bool = False,
+    raster_resampling: Resampling = Resampling.nearest,
+    stats_workers: int | None = None,
 ) -> tuple[pystac.Asset, list[dict]]:
     """Create a Stac Asset.
 
@@ -496,6 +927,12 @@ def create_stac_asset(
         with_raster (bool): Add the `raster` extension and properties (default to False).
         with_eo (bool): Add the `eo` extension and properties (default to False).
         raster_max_size (int): Limit array size from which to get the raster statistics. Defaults to 1024.
+        histogram_bins (int, str or sequence): Histogram bins, forwarded to `numpy.histogram`. Defaults to 10.
+        histogram_range (tuple, optional): Histogram range, forwarded to `numpy.histogram`.
+        compute_stats (bool): Compute raster statistics and histogram (default to True).
+        approx_stats (bool): Compute raster statistics from the coarsest overview (default to False).
+        raster_resampling (rasterio.enums.Resampling): Resampling method used to read the decimated raster for statistics. Defaults to `nearest`.
+        stats_workers (int, optional): Number of threads computing the bands statistics (see `get_raster_info`).
 
     Returns:
         pystac.Asset: valid STAC Asset.
@@ -533,6 +970,10 @@ def create_stac_asset(
                 max_size=raster_max_size,
                 histogram_bins=histogram_bins,
                 histogram_range=histogram_range,
+                compute_stats=compute_stats,
+                approx_stats=approx_stats,
+                resampling=raster_resampling,
+                stats_workers=stats_workers,
             )
 
         eo_bands: list[dict] = []
@@ -587,6 +1028,9 @@ def create_stac_item(
     geographic_crs: rasterio.crs.CRS = EPSG_4326,
     histogram_bins: int | str | Sequence = 10,
     histogram_range: tuple[float, float] | None = None,
+    compute_stats: bool = True,
+    approx_stats: bool = False,
+    raster_resampling: Resampling = Resampling.nearest,
 ) -> pystac.Item:
     """Create a Stac Item.
 
@@ -610,15 +1054,31 @@ def create_stac_item(
         raster_max_size (int): Limit array size from which to get the raster statistics. Defaults to 1024.
         geom_densify_pts (int): Number of points to add to each edge to account for nonlinear edges transformation (Note: GDAL uses 21).
         geom_precision (int): If >= 0, geometry coordinates will be rounded to this number of decimal.
+        histogram_bins (int, str or sequence): Histogram bins, forwarded to `numpy.histogram`. Defaults to 10.
+        histogram_range (tuple, optional): Histogram range, forwarded to `numpy.histogram`.
+        compute_stats (bool): Compute raster statistics and histogram (default to True).
+        approx_stats (bool): Compute raster statistics from the coarsest overview (default to False).
+        raster_resampling (rasterio.enums.Resampling): Resampling method used to read the decimated raster for statistics. Defaults to `nearest`.
 
     Returns:
         pystac.Item: valid STAC Item.
 
     """
     properties = properties or {}
-    extensions = extensions or []
     asset_roles = asset_roles or []
 
+    # Extensions are kept unique (in insertion order)
+    stac_extensions: list[str] = []
+    seen_extensions: set[str] = set()
+
+    def add_extension(url: str):
+        if url not in seen_extensions:
+            seen_extensions.add(url)
+            stac_extensions.append(url)
+
+    for url in extensions or []:
+        add_extension(url)
+
     with ExitStack() as ctx:
         if isinstance(source, (DatasetReader, DatasetWriter, WarpedVRT)):
             dataset = source
@@ -666,27 +1126,19 @@ def create_stac_item(
 
         # add projection properties
         if with_proj:
-            extensions.append(
-                f"https://stac-extensions.github.io/projection/{PROJECTION_EXT_VERSION}/schema.json",
-            )
+            add_extension(PROJECTION_EXT_URL)
 
         # Check if we need to add other extensions
         if with_raster:
-            extensions.append(
-                f"https://stac-extensions.github.io/raster/{RASTER_EXT_VERSION}/schema.json",
-            )
+            add_extension(RASTER_EXT_URL)
 
         if with_eo:
-            extensions.append(
-                f"https://stac-extensions.github.io/eo/{EO_EXT_VERSION}/schema.json",
-            )
+            add_extension(EO_EXT_URL)
 
             cloudcover = src_dst.get_tag_item("CLOUDCOVER", "IMAGERY")
             if cloudcover is not None:
                 properties.update({"eo:cloud_cover": int(cloudcover)})
 
-        extensions = list(dict.fromkeys(extensions))
-
         # item.assets
         generated_asset = None
         if not assets:
@@ -701,11 +1153,17 @@ def create_stac_item(
                 raster_max_size=raster_max_size,
                 histogram_bins=histogram_bins,
                 histogram_range=histogram_range,
+                compute_stats=compute_stats,
+                approx_stats=approx_stats,
+                raster_resampling=raster_resampling,
             )
 
     # Fix Antimeridian
-    fixed_geom = antimeridian.fix_geojson(dataset_geom["footprint"])
-    fixed_bbox = list(feature_bounds(fixed_geom))
+    fixed_geom = _fix_antimeridian(dataset_geom["footprint"])
+    if fixed_geom is dataset_geom["footprint"]:
+        fixed_bbox = dataset_geom["bbox"]
+    else:
+        fixed_bbox = list(feature_bounds(fixed_geom))
 
     # item
     item = pystac.Item(
@@ -713,7 +1171,7 @@ def create_stac_item(
         geometry=fixed_geom,
         bbox=fixed_bbox,
         collection=collection,
-        stac_extensions=extensions,
+        stac_extensions=stac_extensions,
         datetime=input_datetime,
         properties=properties,
     )
@@ -745,15 +1203,23 @@ def create_stac_item(
     elif generated_asset:
         item.add_asset(key=asset_name, asset=generated_asset)
 
-    # Post-processing cleanups (General Best Practices)
-    # 1. Clean Thumbnail
-    # Find asset with 'thumbnail' role or matching name pattern if not set
+    # Post-processing cleanups (General Best Practices), in one pass over the assets:
+    # - find the thumbnail asset ('thumbnail' role or matching name pattern if not set)
+    # - clean metadata assets (no proj:*)
     thumb_key = None
     for key, asset in item.assets.items():
-        if "thumbnail" in (asset.roles or []) or key.endswith("ql") or "-ql" in key:
+        roles = asset.roles or ()
+        if thumb_key is None and (
+            "thumbnail" in roles or key.endswith("ql") or "-ql" in key
+        ):
             thumb_key = key
-            break
 
+        elif "metadata" in roles:
+            asset.extra_fields = {
+                k: v for k, v in asset.extra_fields.items() if not k.startswith("proj:")
+            }
+
+    # 1. Clean Thumbnail
     if thumb_key:
         thumb = item.assets.pop(thumb_key)
         # Set required
@@ -771,31 +1237,21 @@ def create_stac_item(
 
         thumb.extra_fields["proj:code"] = None
 
-        # Remove forbidden fields
-        for k in ["bands", "eo:bands", "raster:bands", "statistics", "stats",
-                  "proj:epsg", "proj:shape", "proj:bbox", "proj:transform",
-                  "proj:geometry", "proj:wkt2", "proj:projjson"]:
-            thumb.extra_fields.pop(k, None)
-
-        # Check if they are in extra_fields keys (e.g. other proj: fields)
-        keys_to_pop = [ek for ek in thumb.extra_fields if ek.startswith("proj:") and ek != "proj:code"]
-        for ek in keys_to_pop:
-            thumb.extra_fields.pop(ek)
+        # Remove forbidden fields (spectral info and proj:* except proj:code)
+        thumb.extra_fields = {
+            k: v
+            for k, v in thumb.extra_fields.items()
+            if k not in THUMBNAIL_FORBIDDEN_FIELDS
+            and (k == "proj:code" or not k.startswith("proj:"))
+        }
 
         # Re-add as 'thumbnail'
         item.assets["thumbnail"] = thumb
 
-    # 2. Clean Metadata Assets (No proj:*)
-    for _, asset in item.assets.items():
-        if "metadata" in (asset.roles or []):
-             keys_to_pop = [k for k in asset.extra_fields if k.startswith("proj:")]
-             for k in keys_to_pop:
-                 asset.extra_fields.pop(k)
-
-    # 3. Clean Item Properties (No proj:*)
+    # 2. Clean Item Properties (No proj:*)
     # Remove proj:* from item properties (moved to assets)
-    keys_to_remove = [k for k in item.properties if k.startswith("proj:")]
-    for k in keys_to_remove:
-        item.properties.pop(k)
+    item.properties = {
+        k: v for k, v in item.properties.items() if not k.startswith("proj:")
+    }
 
     return item
@@ -1,11 +1,19 @@
 """tests rio_stac.cli."""
 
 import json
+import math
 import os
+import subprocess
+import sys
 
 import pystac
+import rasterio
+from rasterio.enums import Resampling
 
-from rio_stac.scripts.cli import stac
+from rio_stac.scripts.cli import _parse_jsonish, stac
+from rio_stac.stac import _get_stats
+
+from .conftest import requires_hdf5
 
 PREFIX = os.path.join(os.path.dirname(__file__), "fixtures")
 
@@ -189,3 +197,241 @@ def test_rio_stac_cli(runner):
             assert "proj:code" in stac_item["properties"]
             assert "proj:projjson" not in stac_item["properties"]
             assert "bands" in stac_item["assets"]["asset"]
+
+
+def test_rio_stac_cli_datetime_interval(runner):
+    """Should keep RFC 3339 interval bounds with their UTC offset."""
+    src_path = os.path.join(PREFIX, "dataset_cog.tif")
+    result = runner.invoke(
+        stac,
+        [
+            src_path,
+            "--without-proj",
+            "--without-raster",
+            "--without-eo",
+            "--datetime",
+            "2010-01-01T00:00:00Z/2010-01-02T12:00:00+02:00",
+        ],
+    )
+    assert not result.exception
+    assert result.exit_code == 0
+    stac_item = json.loads(result.output)
+    assert not stac_item["properties"]["datetime"]
+    assert stac_item["properties"]["start_datetime"] == "2010-01-01T00:00:00Z"
+    assert stac_item["properties"]["end_datetime"] == "2010-01-02T12:00:00+02:00"
+
+    # impossible dates are rejected
+    for interval in [
+        "2010-02-31T00:00:00Z/2010-03-01T00:00:00Z",
+        "2010-01-01T00:00:00Z/2010-01-01T00:00:60Z",
+    ]:
+        result = runner.invoke(stac, [src_path, "--datetime", interval])
+        assert result.exception
+        assert result.exit_code == 2
+        assert "Invalid value for '--datetime'" in result.output
+
+
+def test_rio_stac_cli_mediatype(runner):
+    """Should match media type names case-insensitively."""
+    src_path = os.path.join(PREFIX, "dataset_cog.tif")
+    result = runner.invoke(stac, [src_path, "--asset-mediatype", "cog"])
+    assert not result.exception
+    assert result.exit_code == 0
+    stac_item = json.loads(result.output)
+    assert stac_item["assets"]["asset"]["type"] == pystac.MediaType.COG
+
+    result = runner.invoke(stac, [src_path, "--asset-mediatype", "TIF"])
+    assert result.exception
+    assert result.exit_code == 2
+    assert "Invalid value for '--asset-mediatype'" in result.output
+
+    result = runner.invoke(stac, ["--help"])
+    assert "[COG|" in result.output
+    assert "|auto]" in result.output
+
+
+def test_rio_stac_cli_output(runner, monkeypatch):
+    """Should write the output file atomically."""
+    src_path = os.path.join(PREFIX, "dataset_cog.tif")
+    with runner.isolated_filesystem():
+        result = runner.invoke(stac, [src_path, "-o", "item.json"])
+        assert not result.exception
+        assert result.exit_code == 0
+        with open("item.json", "r") as f:
+            assert json.loads(f.read())["type"] == "Feature"
+        assert not os.path.exists("item.json.tmp")
+
+        def _failing_dumps(obj):
+            raise ValueError("serialization failed")
+
+        # A failed write keeps the previous file and removes the temporary one
+        monkeypatch.setattr("rio_stac.scripts.cli._dumps", _failing_dumps)
+        with open("item.json", "w") as f:
+            f.write("previous")
+        result = runner.invoke(stac, [src_path, "-o", "item.json"])
+        assert isinstance(result.exception, ValueError)
+        with open("item.json", "r") as f:
+            assert f.read() == "previous"
+        assert not os.path.exists("item.json.tmp")
+
+
+def test_parse_jsonish():
+    """Should parse JSON-ish values and keep plain strings untouched."""
+    assert _parse_jsonish("something") == "something"
+    assert _parse_jsonish("") == ""
+    assert _parse_jsonish("true") is True
+    assert _parse_jsonish("1.5") == 1.5
+    assert _parse_jsonish("'abc'") == "abc"
+    assert _parse_jsonish("{'a': 1}") == {"a": 1}
+    assert _parse_jsonish("{hidden: true}") == {"hidden": True}
+    assert _parse_jsonish("trueish") == "trueish"
+    assert _parse_jsonish("{a: 1, b-c : {d: [1, {e: 2}]}}") == {
+        "a": 1,
+        "b-c": {"d": [1, {"e": 2}]},
+    }
+    # quoted values are left untouched
+    assert _parse_jsonish('{a: "x, b: y"}') == {"a": "x, b: y"}
+
+    # cached containers must not be shared between calls
+    parsed = _parse_jsonish("{hidden: true}")
+    parsed["note"] = "abc"
+    assert _parse_jsonish("{hidden: true}") == {"hidden": True}
+
+
+def test_rio_stac_cli_histogram_bins(runner):
+    """Should forward the number of histogram bins."""
+    src_path = os.path.join(PREFIX, "dataset_cog.tif")
+    result = runner.invoke(stac, [src_path, "--histogram-bins", "20"])
+    assert not result.exception
+    assert result.exit_code == 0
+    stac_item = json.loads(result.output)
+    band = stac_item["assets"]["asset"]["bands"][0]
+    assert len(band["raster:histogram"]["buckets"]) == 20
+
+    for bins in ("0", "-1"):
+        result = runner.invoke(stac, [src_path, "--histogram-bins", bins])
+        assert result.exception
+        assert result.exit_code == 2
+        assert "Invalid value for '--histogram-bins'" in result.output
+
+
+def test_rio_stac_cli_stats_options(runner):
+    """Should skip or approximate the raster statistics."""
+    src_path = os.path.join(PREFIX, "dataset_cog.tif")
+    result = runner.invoke(stac, [src_path, "--no-stats"])
+    assert not result.exception
+    assert result.exit_code == 0
+    band = json.loads(result.output)["assets"]["asset"]["bands"][0]
+    assert band["data_type"] == "uint16"
+    assert "statistics" not in band
+    assert "raster:histogram" not in band
+
+    result = runner.invoke(stac, [src_path, "--approx-stats"])
+    assert not result.exception
+    assert result.exit_code == 0
+    approx = json.loads(result.output)["assets"]["asset"]["bands"][0]
+
+    # statistics of the coarsest overview
+    with rasterio.open(src_path) as src:
+        decim = max(src.overviews(1))
+        shape = (math.ceil(src.height / decim), math.ceil(src.width / decim))
+        expected = _get_stats(src.read(1, out_shape=shape, masked=True))
+    assert approx["statistics"] == expected["statistics"]
+    assert approx["raster:histogram"] == expected["raster:histogram"]
+
+    result = runner.invoke(stac, [src_path, "--exact-stats"])
+    assert not result.exception
+    assert result.exit_code == 0
+    exact = json.loads(result.output)["assets"]["asset"]["bands"][0]
+    assert exact["statistics"] != approx["statistics"]
+
+
+def test_rio_stac_cli_raster_resampling(runner):
+    """Should read the decimated raster with the resampling method."""
+    src_path = os.path.join(PREFIX, "dataset_cog.tif")
+    bands = {}
+    for method in ["nearest", "average"]:
+        result = runner.invoke(
+            stac,
+            [src_path, "--max-raster-size", "256", "--raster-resampling", method],
+        )
+        assert not result.exception
+        assert result.exit_code == 0
+        bands[method] = json.loads(result.output)["assets"]["asset"]["bands"][0]
+
+    with rasterio.open(src_path) as src:
+        shape = (256, math.ceil(256 / (src.height / src.width)))
+        expected = _get_stats(
+            src.read(1, out_shape=shape, masked=True, resampling=Resampling.average)
+        )
+    assert bands["average"]["statistics"] == expected["statistics"]
+    assert bands["average"]["statistics"] != bands["nearest"]["statistics"]
+
+    result = runner.invoke(stac, [src_path, "--raster-resampling", "max"])
+    assert result.exception
+    assert result.exit_code == 2
+
+
+def test_rio_stac_cli_metadata_only(runner):
+    """Should only add metadata derived information."""
+    src_path = os.path.join(PREFIX, "dataset_cog.tif")
+    result = runner.invoke(stac, [src_path, "--metadata-only"])
+    assert not result.exception
+    assert result.exit_code == 0
+    stac_item = json.loads(result.output)
+    assert stac_item["stac_extensions"] == [
+        "https://stac-extensions.github.io/projection/v2.0.0/schema.json",
+    ]
+    assert "bands" not in stac_item["assets"]["asset"]
+    assert stac_item["assets"]["asset"]["proj:shape"]
+
+
+def test_lazy_submodules():
+    """Submodules should be reachable from the package without importing them."""
+    code = (
+        "import rio_stac; "
+        "assert callable(rio_stac.stac.get_raster_info); "
+        "assert rio_stac.scripts.__name__ == 'rio_stac.scripts'; "
+        "assert rio_stac.create_stac_item is rio_stac.stac.create_stac_item"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@requires_hdf5
+def test_rio_stac_cli_no_bands(runner):
+    """Should create items for datasets without bands."""
+    src_path = os.path.join(PREFIX, "dataset.h5")
+    result = runner.invoke(stac, [src_path])
+    assert not result.exception
+    assert result.exit_code == 0
+    stac_item = json.loads(result.output)
+    assert stac_item["assets"]["asset"]["href"] == src_path
+
+
+def test_rio_stac_cli_mixed_dtypes(runner, tmp_path):
+    """Should compute statistics of bands with different data types."""
+    src_path = os.path.abspath(os.path.join(PREFIX, "dataset.tif"))
+    with rasterio.open(src_path) as src:
+        width, height = src.width, src.height
+
+    bands = "".join(
+        f"""
+        <VRTRasterBand dataType="{dtype}" band="{band}">
+            <SimpleSource>
+                <SourceFilename relativeToVRT="0">{src_path}</SourceFilename>
+                <SourceBand>1</SourceBand>
+            </SimpleSource>
+        </VRTRasterBand>"""
+        for band, dtype in enumerate(["Byte", "Float32"], 1)
+    )
+    vrt = tmp_path / "mixed.vrt"
+    vrt.write_text(
+        f'<VRTDataset rasterXSize="{width}" rasterYSize="{height}">{bands}\n</VRTDataset>'
+    )
+
+    result = runner.invoke(stac, [str(vrt)])
+    assert not result.exception
+    assert result.exit_code == 0
+    bands = json.loads(result.output)["assets"]["asset"]["bands"]
+    assert [band["data_type"] for band in bands] == ["uint8", "float32"]
+    assert all("statistics" in band for band in bands)
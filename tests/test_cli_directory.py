@@ -57,12 +57,34 @@ def test_cli_recursive_basic(test_dir):
     assert "image" in item["assets"]
     assert "thumbnail" in item["assets"]
     assert "meta" in item["assets"]
+    # files are processed in name order (thumbnail is moved last)
+    assert list(item["assets"]) == ["image", "meta", "thumbnail"]
     
     # Check roles
     assert "data" in item["assets"]["image"]["roles"]
     assert "thumbnail" in item["assets"]["thumbnail"]["roles"]
     assert "metadata" in item["assets"]["meta"]["roles"]
 
+
+def test_cli_recursive_jobs(test_dir):
+    """Test that concurrent processing gives the same assets in the same order."""
+    runner = CliRunner()
+    assets = {}
+    for jobs in ["1", "2"]:
+        result = runner.invoke(stac, [str(test_dir), "--recursive", "-j", jobs])
+        assert result.exit_code == 0
+        assets[jobs] = json.loads(result.output)["assets"]
+
+    assert list(assets["2"]) == list(assets["1"]) == ["image", "meta", "thumbnail"]
+    assert assets["2"] == assets["1"]
+    assert "statistics" in assets["2"]["image"]["bands"][0]
+
+    for jobs in ["0", "-1"]:
+        result = runner.invoke(stac, [str(test_dir), "--recursive", "-j", jobs])
+        assert result.exit_code == 2
+        assert "Invalid value for '--jobs'" in result.output
+
+
 def test_cli_recursive_pattern(test_dir):
     """Test recursive processing with pattern filtering."""
     runner = CliRunner()
@@ -158,3 +180,23 @@ def test_cli_recursive_private_data_implicit(test_dir):
     # Check merging
     assert private["note"] == "secret"
     assert private["user"] == "me"
+
+def test_cli_recursive_exclude_dir(test_dir):
+    """Test recursive processing skips excluded sub-directories."""
+    sub = test_dir / "overviews"
+    sub.mkdir()
+    shutil.copy("tests/fixtures/dataset.tif", sub / "overview.tif")
+
+    runner = CliRunner()
+    result = runner.invoke(stac, [str(test_dir), "--recursive"])
+    assert result.exit_code == 0
+    item = json.loads(result.output)
+    assert "overview" in item["assets"]
+
+    result = runner.invoke(
+        stac, [str(test_dir), "--recursive", "--exclude-dir", "overview*"]
+    )
+    assert result.exit_code == 0
+    item = json.loads(result.output)
+    assert "overview" not in item["assets"]
+    assert "image" in item["assets"]
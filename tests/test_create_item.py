@@ -1,34 +1,68 @@
 """Tests for STAC Item creation and post-processing."""
 import json
+import math
 import os
 import shutil
 from click.testing import CliRunner
 from rio_stac.scripts.cli import stac
+import antimeridian
+import numpy
 import pytest
+import rasterio
+from rasterio.enums import Resampling
 from rio_stac import build_stac_assets, create_stac_item
+from rio_stac.stac import (
+    _count_unique,
+    _fix_antimeridian,
+    _walk_files,
+    _get_stats,
+    _histogram,
+    get_raster_info,
+)
 
-@pytest.fixture
-def s2_safe_dir(tmp_path):
-    """Create a mock Sentinel-2 SAFE directory structure."""
-    safe_dir = tmp_path / "S2A_MSIL1C_20251128T111431_N0511_R137_T31VEE_20251128T121631.SAFE"
-    safe_dir.mkdir()
 
-    # Metadata
-    (safe_dir / "MTD_MSIL1C.xml").write_text("<xml>metadata</xml>")
-    (safe_dir / "manifest.safe").write_text("<safe>manifest</safe>")
+def _link_or_copy(src, dst):
+    """Hardlink `src` to `dst` (fixtures are read-only), copying if linking fails."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy(src, dst)
+
+
+@pytest.fixture(scope="module")
+def fake_quicklook(tmp_path_factory):
+    """Write the simulated quicklook once per module."""
+    path = tmp_path_factory.mktemp("ql") / "ql.jpg"
+    path.write_bytes(b"fake_jpeg_content")
+    return path
 
-    # Granule dir
+
+@pytest.fixture(scope="module")
+def s2_safe_dir(tmp_path_factory, fake_quicklook):
+    """Create a mock Sentinel-2 SAFE directory structure (read-only, shared)."""
+    safe_dir = (
+        tmp_path_factory.mktemp("s2")
+        / "S2A_MSIL1C_20251128T111431_N0511_R137_T31VEE_20251128T121631.SAFE"
+    )
+    # Granule dir (also creates the SAFE root)
     granule_dir = safe_dir / "GRANULE" / "L1C_T31VEE_A054503_20251128T111434" / "IMG_DATA"
     granule_dir.mkdir(parents=True)
 
-    # Fake Raster Bands (copy from fixture)
+    # Metadata
+    (safe_dir / "MTD_MSIL1C.xml").write_text("<xml>metadata</xml>")
+    (safe_dir / "manifest.safe").write_text("<safe>manifest</safe>")
+
+    # Fake Raster Bands (linked from fixture)
     fixture_path = "tests/fixtures/dataset.tif"
     if os.path.exists(fixture_path):
-        shutil.copy(fixture_path, granule_dir / "T31VEE_20251128T111431_B03.jp2")
-        shutil.copy(fixture_path, granule_dir / "T31VEE_20251128T111431_B04.jp2")
+        _link_or_copy(fixture_path, granule_dir / "T31VEE_20251128T111431_B03.jp2")
+        _link_or_copy(fixture_path, granule_dir / "T31VEE_20251128T111431_B04.jp2")
 
     # Quicklook (simulated)
-    (safe_dir / "S2A_MSIL1C_20251128T111431_N0511_R137_T31VEE_20251128T121631-ql.jpg").write_bytes(b"fake_jpeg_content")
+    _link_or_copy(
+        fake_quicklook,
+        safe_dir / "S2A_MSIL1C_20251128T111431_N0511_R137_T31VEE_20251128T121631-ql.jpg",
+    )
 
     return safe_dir
 
@@ -54,8 +88,9 @@ def test_s2_l1c_builder(s2_safe_dir):
     assets = item["assets"]
 
     # Verify Assets existence
-    assert any(k.endswith("B03") for k in assets)
-    assert any(k.endswith("B04") for k in assets)
+    suffixes = {k.rsplit("_", 1)[-1] for k in assets}
+    assert "B03" in suffixes
+    assert "B04" in suffixes
     assert "MTD_MSIL1C" in assets
     assert "manifest" in assets
 
@@ -69,6 +104,12 @@ def test_s2_l1c_builder(s2_safe_dir):
     assert "metadata" in assets["MTD_MSIL1C"]["roles"]
     assert "metadata" in assets["manifest"]["roles"]
 
+
+def _proj_keys(d, allowed=frozenset()):
+    """Return the `proj:*` keys of `d` not listed in `allowed`."""
+    return {k for k in d if k.startswith("proj:")} - allowed
+
+
 def test_general_post_processing(s2_safe_dir):
     """Test that create_stac_item applies general post-processing rules."""
 
@@ -85,11 +126,8 @@ def test_general_post_processing(s2_safe_dir):
 
     # 2. Create Item
     # Find a source
-    source_path = None
-    for key, asset in assets.items():
-        if "B03" in key:
-             source_path = os.path.join(str(s2_safe_dir), asset.href)
-             break
+    b03_key = next(k for k in assets if k.endswith("B03"))
+    source_path = os.path.join(str(s2_safe_dir), assets[b03_key].href)
 
     item = create_stac_item(
         source=source_path,
@@ -103,8 +141,7 @@ def test_general_post_processing(s2_safe_dir):
     item_dict = item.to_dict()
 
     # 3.1 Check Item Properties (No proj:*)
-    for k in item_dict["properties"]:
-        assert not k.startswith("proj:"), f"Item property {k} starts with proj:"
+    assert not _proj_keys(item_dict["properties"])
 
     assets = item_dict["assets"]
 
@@ -118,18 +155,237 @@ def test_general_post_processing(s2_safe_dir):
     assert "raster:bands" not in thumb
 
     # Ensure no other proj fields
-    for k in thumb:
-        if k.startswith("proj:") and k != "proj:code":
-            raise AssertionError(f"Thumbnail has forbidden field {k}")
+    assert not _proj_keys(thumb, allowed={"proj:code"})
 
     # 5. Check Metadata
     meta = assets["MTD_MSIL1C"]
     assert "metadata" in meta["roles"]
-    for k in meta:
-        assert not k.startswith("proj:")
+    assert not _proj_keys(meta)
 
     # 3.2 Check Data (Raster)
-    # Find a band
-    band_key = next(k for k in assets if "B03" in k)
-    band = assets[band_key]
+    band = assets[b03_key]
     assert "data" in band["roles"]
+
+
+@pytest.fixture(scope="module")
+def cog_dataset():
+    """Open dataset_cog.tif once for the module's tests."""
+    with rasterio.open("tests/fixtures/dataset_cog.tif") as src:
+        yield src
+
+
+def test_create_item_stats_options(cog_dataset):
+    """Test skipping or approximating raster statistics."""
+    src = cog_dataset
+
+    item = create_stac_item(src, with_raster=True)
+    band = item.assets["asset"].extra_fields["bands"][0]
+    assert "statistics" in band
+    assert "raster:histogram" in band
+
+    item = create_stac_item(src, with_raster=True, compute_stats=False)
+    band = item.assets["asset"].extra_fields["bands"][0]
+    assert band["data_type"]
+    assert "statistics" not in band
+    assert "raster:histogram" not in band
+
+    item = create_stac_item(src, with_raster=True, approx_stats=True)
+    band = item.assets["asset"].extra_fields["bands"][0]
+    assert band["statistics"]["minimum"] is not None
+    assert "raster:histogram" in band
+
+    # approximated statistics are computed from the coarsest overview
+    decim = max(src.overviews(1))
+    shape = (math.ceil(src.height / decim), math.ceil(src.width / decim))
+    expected = _get_stats(src.read(1, out_shape=shape, masked=True))
+    assert band["statistics"] == expected["statistics"]
+
+    item = create_stac_item(src, with_raster=True, raster_resampling=Resampling.average)
+    band = item.assets["asset"].extra_fields["bands"][0]
+    assert band["statistics"]["valid_percent"] > 0
+
+
+def test_raster_info_stats_workers():
+    """Bands statistics computed in threads should keep the bands order."""
+    src_path = (
+        "tests/fixtures/S2A_MSIL2A_20220722T105631_N0400_R094_T31TCN_20220722T171159.tif"
+    )
+    with rasterio.open(src_path) as src, pytest.warns(UserWarning):
+        assert get_raster_info(src, stats_workers=4) == get_raster_info(
+            src, stats_workers=1
+        )
+
+
+def test_raster_info_bands_groups(monkeypatch):
+    """Bands read in bounded groups should give the same statistics."""
+    src_path = (
+        "tests/fixtures/S2A_MSIL2A_20220722T105631_N0400_R094_T31TCN_20220722T171159.tif"
+    )
+    with rasterio.open(src_path) as src, pytest.warns(UserWarning):
+        expected = get_raster_info(src, max_size=128)
+
+        # a single band exceeds the budget: one read per band
+        reads = []
+        read = src.read
+        monkeypatch.setattr("rio_stac.stac.STATS_READ_MAX_BYTES", 1)
+        monkeypatch.setattr(
+            src, "read", lambda *a, **kw: reads.append(a) or read(*a, **kw)
+        )
+        assert get_raster_info(src, max_size=128) == expected
+        assert len(reads) == src.count
+
+
+def test_build_assets_jobs(s2_safe_dir):
+    """Test that concurrent asset creation keeps the files order."""
+    serial = build_stac_assets(directory=str(s2_safe_dir), with_raster=True)
+    threaded = build_stac_assets(directory=str(s2_safe_dir), with_raster=True, jobs=4)
+    assert list(serial) == list(threaded)
+    assert [a.to_dict() for a in serial.values()] == [
+        a.to_dict() for a in threaded.values()
+    ]
+
+
+def test_build_assets_jobs_stats_workers(s2_safe_dir, monkeypatch):
+    """Concurrent workers should not start their own statistics thread pools."""
+    workers = []
+    raster_info = get_raster_info
+
+    def _get_raster_info(*args, **kwargs):
+        workers.append(kwargs["stats_workers"])
+        return raster_info(*args, **kwargs)
+
+    monkeypatch.setattr("rio_stac.stac.get_raster_info", _get_raster_info)
+    build_stac_assets(directory=str(s2_safe_dir), with_raster=True, jobs=2)
+    assert workers == [1, 1]
+
+    workers.clear()
+    build_stac_assets(directory=str(s2_safe_dir), with_raster=True)
+    assert workers == [None, None]
+
+
+def test_walk_files_errors(s2_safe_dir, tmp_path, monkeypatch):
+    """Unreadable or missing directories should be skipped like os.walk does."""
+    assert build_stac_assets(directory=str(tmp_path / "missing")) == {}
+
+    scandir = os.scandir
+    denied = str(s2_safe_dir / "GRANULE")
+
+    def _scandir(path):
+        if str(path) == denied:
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", _scandir)
+    files = [os.path.basename(f) for f in _walk_files(str(s2_safe_dir))]
+    assert files == [
+        "MTD_MSIL1C.xml",
+        "S2A_MSIL1C_20251128T111431_N0511_R137_T31VEE_20251128T121631-ql.jpg",
+        "manifest.safe",
+    ]
+
+
+@pytest.mark.parametrize(
+    "bins,hrange", [(10, None), (10, (0, 100)), ("auto", None), ([0, 10, 100], None)]
+)
+@pytest.mark.parametrize("dtype", ["uint8", "int16", "float32"])
+@pytest.mark.parametrize("fast", [True, False])
+def test_histogram(bins, hrange, dtype, fast, monkeypatch):
+    """Should match numpy.histogram."""
+    if not fast:
+        monkeypatch.setattr("rio_stac.stac.histogram1d", None)
+
+    data = numpy.random.default_rng(0).integers(-20, 255, 10000).astype(dtype)
+    if dtype == "uint8":
+        data = data.clip(5, 250)
+    sample, edges = _histogram(data, bins=bins, range=hrange)
+    np_sample, np_edges = numpy.histogram(data, bins=bins, range=hrange)
+    numpy.testing.assert_array_equal(sample, np_sample)
+    numpy.testing.assert_allclose(edges, np_edges)
+
+
+@pytest.mark.parametrize("hrange", [None, (0, 3000), (0, 10000)])
+@pytest.mark.parametrize("dtype", ["int32", "uint32", "float32", "float64"])
+def test_histogram_bin_edges(hrange, dtype):
+    """Values on the bin edges should be binned as numpy.histogram does."""
+    vmax = 10000 if hrange is None else hrange[1]
+    data = numpy.random.default_rng(0).integers(0, vmax + 1, 100000).astype(dtype)
+    sample, edges = _histogram(data, bins=255, range=hrange)
+    np_sample, np_edges = numpy.histogram(data, bins=255, range=hrange)
+    numpy.testing.assert_array_equal(sample, np_sample)
+    numpy.testing.assert_array_equal(edges, np_edges)
+
+
+def test_get_stats():
+    """Should only use valid values."""
+    data = numpy.arange(16, dtype="float32").reshape(4, 4)
+
+    stats = _get_stats(numpy.ma.MaskedArray(data))
+    assert stats["statistics"]["valid_percent"] == 100.0
+    assert stats["statistics"]["minimum"] == 0
+    assert stats["statistics"]["maximum"] == 15
+
+    stats = _get_stats(numpy.ma.MaskedArray(data, mask=data < 4))
+    assert stats["statistics"]["valid_percent"] == 75.0
+    assert stats["statistics"]["minimum"] == 4
+    assert sum(stats["raster:histogram"]["buckets"]) == 12
+
+    stats = _get_stats(numpy.ma.MaskedArray(data, mask=True))
+    assert stats["statistics"]["valid_percent"] == 0.0
+    assert stats["statistics"]["mean"] == 0.0
+
+    # non-finite values are masked
+    stats = _get_stats(
+        numpy.ma.MaskedArray(numpy.array([1.0, numpy.nan, numpy.inf, 3.0]))
+    )
+    assert stats["statistics"]["valid_percent"] == 50.0
+    assert stats["statistics"]["maximum"] == 3.0
+
+    # mean and stddev are accumulated in float64
+    stats = _get_stats(numpy.ma.MaskedArray(numpy.full((512, 512), 1.1, dtype="float32")))
+    assert stats["statistics"]["stddev"] == 0.0
+    assert stats["statistics"]["mean"] == float(numpy.float32(1.1))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        numpy.array([-100, 0, 100, 100], dtype="int8"),
+        numpy.array([1, 1, 65535], dtype="uint16"),
+        numpy.array([2**63 + 5, 2**63 + 9], dtype="uint64"),
+        numpy.array([0.5, 0.5, 1.5]),
+        numpy.array([], dtype="uint8"),
+    ],
+)
+def test_count_unique(data):
+    """Should match numpy.unique."""
+    assert _count_unique(data) == len(numpy.unique(data))
+
+
+@pytest.mark.parametrize(
+    "coords",
+    [
+        [[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]],
+        [[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]],
+        [[175, 0], [-175, 0], [-175, 1], [175, 1], [175, 0]],
+    ],
+)
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_fix_antimeridian(coords):
+    """Should match antimeridian.fix_geojson."""
+    geom = {"type": "Polygon", "coordinates": [coords]}
+    expected = antimeridian.fix_geojson(geom)
+    fixed = _fix_antimeridian(geom)
+    assert fixed["type"] == expected["type"]
+    assert numpy.allclose(
+        numpy.asarray(fixed["coordinates"], dtype="float64"),
+        numpy.asarray(expected["coordinates"], dtype="float64"),
+    )
+
+
+def test_build_assets_patterns(s2_safe_dir):
+    """Test filename and relative path patterns."""
+    assets = build_stac_assets(
+        directory=str(s2_safe_dir),
+        patterns=["GRANULE/*/IMG_DATA/*_B03.jp2", "MTD_*.xml"],
+    )
+    assert sorted(assets) == ["MTD_MSIL1C", "T31VEE_20251128T111431_B03"]